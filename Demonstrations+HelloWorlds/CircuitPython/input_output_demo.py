@@ -1,37 +1,42 @@
 import time
-from mtm_computer import Computer, gamma_correct
+import array
+from mtm_computer import Computer
 
 # Setup
 comp = Computer()
 
-last_log_time = 0.0
+last_log_ns = 0
+log = [0] * 10  # filled in place on each log line
+
+# Logged pulse values, indexed by the 0/1 pulse state
+_PULSE_LOG = (32768, 65535)
+
+# Mux inputs (knobs, switch, CV ins) are only updated every 4th loop,
+# audio and pulse I/O still run every loop
+tick = 0
+
+# rect_scale() precomputed for the top 8 bits of the raw input
+_RECT_LUT = array.array('H', [0 if i < 128 else (i - 128) * 2 * 256 for i in range(256)])
 
 def rect_scale(raw: int) -> int:
     """Scales positive values for led"""
-    return (raw - 32768) * 2 if raw > 32768 else 0
+    return _RECT_LUT[raw >> 8]
 
 while True:
-    # 1. Update hardware
-    comp.update()
-    current_time = time.monotonic()
-
-    # 2. Read raw inputs
-    # Corrected property names to match the library
-    a1_raw = comp.audio_1_in 
-    a2_raw = comp.audio_2_in
-    cv1_raw = comp.cv_1_in
-    cv2_raw = comp.cv_2_in
-    main_knob = comp.knob_main
-    x_knob = comp.knob_x
-    y_knob = comp.knob_y
-    p1_state = comp.pulse_1_in
-    p2_state = comp.pulse_2_in
-    switch_raw = comp.switch
+    # 1. Update hardware (one mux channel per update(), so a full sweep every 16 loops)
+    if tick == 0:
+        comp.update()
+    tick = (tick + 1) & 3  # wraps, so it stays a small int
+
+    # 2. Read raw inputs (all at once, see Computer.snapshot())
+    (a1_raw, a2_raw, cv1_raw, cv2_raw,
+     main_knob, x_knob, y_knob, switch_raw,
+     p1_state, p2_state) = comp.snapshot()
 
     # --- Processing and LED/CV Assignment ---
 
     # Initialize all lights off.
-    led_0_bright, led_1_bright, led_2_bright, led_3_bright, led_4_bright, led_5_bright = 0, 0, 0, 0, 0, 0
+    bright = [0] * 6
 
     # Set default/reset states for outputs
     # DAC_MID_VAL_16BIT = 32768 (0V for 16-bit input to new setter)
@@ -48,8 +53,9 @@ while True:
 
         # All Outputs mirror Inputs
         # CV Output Mirroring
-        comp.cv_1_out = cv1_raw
-        comp.cv_2_out = cv2_raw
+        # (inputs are always 0-65535, so the unchecked set_cv() is safe)
+        comp.set_cv(0, cv1_raw)
+        comp.set_cv(1, cv2_raw)
 
         # Audio Output Mirroring (16-bit value is now passed directly)
         audio_out_1_val = a1_raw
@@ -60,41 +66,42 @@ while True:
         pulse_out_2_state = p2_state
 
         # LED Visualization
-        led_0_bright = rect_scale(a1_raw)
-        led_1_bright = rect_scale(a2_raw)
-        led_2_bright = rect_scale(cv1_raw)
-        led_3_bright = rect_scale(cv2_raw)
-        led_4_bright = 65535 if p1_state else 0
-        led_5_bright = 65535 if p2_state else 0
+        bright[0] = rect_scale(a1_raw)
+        bright[1] = rect_scale(a2_raw)
+        bright[2] = rect_scale(cv1_raw)
+        bright[3] = rect_scale(cv2_raw)
+        bright[4] = 65535 if p1_state else 0
+        bright[5] = 65535 if p2_state else 0
 
     # SWITCH DOWN
     elif switch_raw < 15000:
         print("SWITCH DOWN")
 
 
-    # Assign DAC Audio Outs (Corrected property names)
-    comp.audio_1_out = audio_out_1_val
-    comp.audio_2_out = audio_out_2_val
+    # Assign DAC Audio Outs
+    comp.set_audio_both(audio_out_1_val, audio_out_2_val)
 
     # Assign Pulse Outs
     comp.pulse_1_out = pulse_out_1_state
     comp.pulse_2_out = pulse_out_2_state
 
-    # Assign LEDs
-    comp.leds[0].duty_cycle = gamma_correct(led_0_bright)
-    comp.leds[1].duty_cycle = gamma_correct(led_1_bright)
-    comp.leds[2].duty_cycle = gamma_correct(led_2_bright)
-    comp.leds[3].duty_cycle = gamma_correct(led_3_bright)
-    comp.leds[4].duty_cycle = gamma_correct(led_4_bright)
-    comp.leds[5].duty_cycle = gamma_correct(led_5_bright)
+    # Assign LEDs (gamma-corrected in one call)
+    comp.leds_set_all(*bright)
 
     # Log current status in tuple format
 
-    if current_time - last_log_time >= 0.1:
-        last_log_time = current_time
-        print((
-            a1_raw, a2_raw, cv1_raw, cv2_raw,
-            main_knob, x_knob, y_knob, switch_raw,
-            # Logging Pulse states for clarity
-            32768 + 32767 * int(p1_state), 32768 + 32767 * int(p2_state)
-        ))
\ No newline at end of file
+    now = time.monotonic_ns()
+    if now - last_log_ns >= 100_000_000:  # 100 ms, integer ns avoids float math per loop
+        last_log_ns = now
+        log[0] = a1_raw
+        log[1] = a2_raw
+        log[2] = cv1_raw
+        log[3] = cv2_raw
+        log[4] = main_knob
+        log[5] = x_knob
+        log[6] = y_knob
+        log[7] = switch_raw
+        # Logging Pulse states for clarity
+        log[8] = _PULSE_LOG[p1_state]
+        log[9] = _PULSE_LOG[p2_state]
+        print(tuple(log))  # tuple format keeps the Mu plotter happy
\ No newline at end of file
@@ -21,6 +21,7 @@ import audiopwmio
 import audiomixer
 import math
 import time
+import array
 # import struct
 
 # Rough calibrations from one device
@@ -66,19 +67,45 @@ DAC_SCK = board.GP18
 # DAC parameters (Buffered, 1x Gain: 0011 / 1011)
 DAC_config_chan_A_gain = 0b0011000000000000
 DAC_config_chan_B_gain = 0b1011000000000000
+# Config bits only occupy the high byte, so a DAC word packs as (hi_base | code >> 8, code & 0xFF)
+_HI_BASE = (DAC_config_chan_A_gain >> 8, DAC_config_chan_B_gain >> 8)
 
 LED_PINS = (board.GP10, board.GP11, board.GP12, board.GP13, board.GP14, board.GP15)
 
 CHANNEL_COUNT = 8  # three knobs, 1 switch, 2 CV (= six? I guess two analog ins?)
 
+# Integer smoothing for mux inputs: new = (old*5 + sample*11) >> 4, i.e. ~0.3 of the old value
+_A_NUM = 5
+_B_NUM = 11
+_SHIFT = 4
+
+# analog[] slots filled per mux channel: (mux1 target, mux2 target)
+# mux1: main knob, X knob, Y knob, switch -- mux2: CV 1, CV 2, CV 1, CV 2 (inverted)
+_MUX_SLOTS = ((4, 2), (5, 3), (6, 2), (7, 3))
+
 
 def map_range(s, a1, a2, b1, b2):
     """Like Arduino ``map()``"""
     return b1 + ((s - a1) * (b2 - b1) / (a2 - a1))
 
+# Fixed-point millivolts per CV count, from the calibration points (-6v to +6v span)
+_CV_SHIFT = 16
+_CV_SCALE = (12000 << _CV_SHIFT) // (CVhighPoint - CVlowPoint)
+
+def raw_to_cv(x):
+    """Convert a raw 16-bit CV value (calibration units, CVzeroPoint = 0v) to integer millivolts.
+    Integer-only, instead of ``map_range(x, CVlowPoint, CVhighPoint, -6000, 6000)``"""
+    return ((x - CVzeroPoint) * _CV_SCALE) >> _CV_SHIFT
+
+# Gamma curve precomputed at import, 1024 entries covering 64-value buckets of the 16-bit input
+# (no @micropython.native: CircuitPython builds mostly lack the native emitter, where the
+# decorator is a compile-time SyntaxError that can't be caught, and a table load gains little)
+_GAMMA_LUT = array.array('H', [(i*i*64*64) // 65535 for i in range(1024)])
+
 def gamma_correct(x):
-    """simple and dumb LED brightness gamma-correction"""
-    return min(max(int((x*x)/65535), 0), 65535)
+    """simple and dumb LED brightness gamma-correction, 16-bit in (0-65535), 16-bit out.
+    Accepts floats and clamps out-of-range input, see ``leds_set_all()`` for the unchecked int path"""
+    return _GAMMA_LUT[min(max(int(x), 0), 65535) >> 6]
 
 class Computer:
     """
@@ -93,20 +120,26 @@ class Computer:
         self.audio_2_in_read = analogio.AnalogIn(AUDIO_2_IN_PIN)
         
         self.mux_count = 0
-        self.analog_smooth_amount = 0.3
         
         # Internal state for dac
-        self._audio_1_out_value = 0
-        self._audio_2_out_value = 0
-
-        self.leds = []
-        for pin in LED_PINS:
-            d = pwmio.PWMOut(pin, frequency=60_000, duty_cycle=0)
-            self.leds.append(d)
+        self._audio_out_value = [0, 0]  # last raw 16-bit value per channel, indexed like set_audio_out()
+        self._dac_buf = bytearray(2)  # reused for every DAC write, avoids per-sample allocation
+        self._dac_buf4 = bytearray(4)  # both channel words, for the two-channel writes
+        self._dac_code = [-1, -1]  # last 12-bit code written per channel, -1 = not written yet
+
+        self._led0 = pwmio.PWMOut(LED_PINS[0], frequency=60_000, duty_cycle=0)
+        self._led1 = pwmio.PWMOut(LED_PINS[1], frequency=60_000, duty_cycle=0)
+        self._led2 = pwmio.PWMOut(LED_PINS[2], frequency=60_000, duty_cycle=0)
+        self._led3 = pwmio.PWMOut(LED_PINS[3], frequency=60_000, duty_cycle=0)
+        self._led4 = pwmio.PWMOut(LED_PINS[4], frequency=60_000, duty_cycle=0)
+        self._led5 = pwmio.PWMOut(LED_PINS[5], frequency=60_000, duty_cycle=0)
+        # Tuple for leds_set_all() to unpack in one go, list kept as the public per-LED API
+        self._led_tuple = (self._led0, self._led1, self._led2, self._led3, self._led4, self._led5)
+        self.leds = list(self._led_tuple)
 
         self.mux_A = digitalio.DigitalInOut(MUX_LOGIC_A)
         self.mux_B = digitalio.DigitalInOut(MUX_LOGIC_B)
-        self.mux_A.switch_to_output()
+        self.mux_A.switch_to_output()  # both low, mux channel 0 selected for the first update()
         self.mux_B.switch_to_output()
 
         self.pulse_1_in_read = digitalio.DigitalInOut(PULSE_1_INPUT)
@@ -119,14 +152,17 @@ class Computer:
         self._pulse_2_out_pin = digitalio.DigitalInOut(PULSE_2_RAW_OUT)
         self._pulse_1_out_pin.switch_to_output(value=True) 
         self._pulse_2_out_pin.switch_to_output(value=True)
+        self._pulse_out_level = [True, True]  # last pin levels written, to skip unchanged writes
 
         self.cv_1_pwm = pwmio.PWMOut(CV_1_PWM, frequency=60_000, duty_cycle=CVzeroPoint)
         self.cv_2_pwm = pwmio.PWMOut(CV_2_PWM, frequency=60_000, duty_cycle=CVzeroPoint)
+        self._cv_out_duty = [CVzeroPoint, CVzeroPoint]  # last duty cycles written
+        self._cv_pwm = (self.cv_1_pwm, self.cv_2_pwm)  # indexed by set_cv()
 
+        # The SPI bus is dedicated to the DAC, so the lock is held until close()
         self.dac_spi = busio.SPI(clock=DAC_SCK, MOSI=DAC_SDI)
         if self.dac_spi.try_lock():
             self.dac_spi.configure(baudrate=20_000_000)
-            self.dac_spi.unlock()
         else:
             print("could not configure DAC SPI")
 
@@ -137,11 +173,43 @@ class Computer:
             self.update()   # pre-read all the mux inputs
 
     def update(self):
-        """Update the comptuer inputs. Should be called frequently"""
-        self.mux_update(self.mux_count)
-        self.mux_read(self.mux_count)
-        self.mux_count = (self.mux_count + 1) % 4
+        """Update the comptuer inputs. Should be called frequently.
+        Each call reads the knob/switch and CV on the currently selected mux channel
+        into the ``analog`` list, then selects the next one, a full sweep takes four calls"""
+        # read both ADCs first, the mux was switched at the end of the previous call
+        # so it has had time to settle
+        v1 = self.analog_mux1.value
+        v2 = self.analog_mux2.value
+        m = self.mux_count
+        k, c = _MUX_SLOTS[m]
+        a = self.analog
+        a[k] = (a[k]*_A_NUM + v1*_B_NUM) >> _SHIFT  # knob / switch
+        a[c] = (a[c]*_A_NUM + v2*_B_NUM) >> _SHIFT  # CV in (inverted)
+        m = (m + 1) & 3
+        self.mux_A.value = m & 1
+        self.mux_B.value = (m >> 1) & 1
+        self.mux_count = m
         
+    def leds_set_all(self, b0, b1, b2, b3, b4, b5):
+        """Set all six LEDs at once from raw 0-65535 int brightness values, gamma-corrected"""
+        g = _GAMMA_LUT
+        l0, l1, l2, l3, l4, l5 = self._led_tuple
+        l0.duty_cycle = g[b0 >> 6]
+        l1.duty_cycle = g[b1 >> 6]
+        l2.duty_cycle = g[b2 >> 6]
+        l3.duty_cycle = g[b3 >> 6]
+        l4.duty_cycle = g[b4 >> 6]
+        l5.duty_cycle = g[b5 >> 6]
+
+    def snapshot(self):
+        """All inputs in one call, same values as the properties:
+        (audio_1_in, audio_2_in, cv_1_in, cv_2_in, knob_main, knob_x, knob_y, switch,
+        pulse_1_in, pulse_2_in), except the pulse inputs are ints, 1 if high, 0 if low"""
+        a = self.analog
+        return (65535 - self.audio_1_in_read.value, 65535 - self.audio_2_in_read.value,
+                65535 - a[2], 65535 - a[3], a[4], a[5], a[6], a[7],
+                1 - self.pulse_1_in_read.value, 1 - self.pulse_2_in_read.value)
+
     @property
     def knob_main(self):
         """Main knob position, raw 0-65535"""
@@ -196,7 +264,11 @@ class Computer:
     @pulse_1_out.setter
     def pulse_1_out(self, value):
         """Sets Pulse 1 Output state (True = active)."""
-        self._pulse_1_out_pin.value = not bool(value)
+        level = not bool(value)
+        if level == self._pulse_out_level[0]:
+            return
+        self._pulse_out_level[0] = level
+        self._pulse_1_out_pin.value = level
 
     @property
     def pulse_2_out(self):
@@ -206,35 +278,43 @@ class Computer:
     @pulse_2_out.setter
     def pulse_2_out(self, value):
         """Sets Pulse 2 Output state (True = active)."""
-        self._pulse_2_out_pin.value = not bool(value)
+        level = not bool(value)
+        if level == self._pulse_out_level[1]:
+            return
+        self._pulse_out_level[1] = level
+        self._pulse_2_out_pin.value = level
 
     @property
     def audio_1_out(self):
         """DAC Audio 1 Output value (Raw 16-bit input)."""
-        return self._audio_1_out_value
+        return self._audio_out_value[0]
 
     @audio_1_out.setter
     def audio_1_out(self, value):
         """Sets DAC Audio 1 Output. Accepts 16-bit (0-65535), scales to 12-bit (0-4095)."""
         # Store the raw 16-bit input value
-        self._audio_1_out_value = value
+        self._audio_out_value[0] = value
         
-        # Write to DAC (inverted: 4095 - dac_value)
-        self.dac_write(0, 4095 - (int(value) // 16)) # Channel 0 = DAC A
+        # Write to DAC (inverted: 4095 - dac_value), skipped if the DAC already has it
+        code = (4095 - (int(value) // 16)) & 0xFFF
+        if code != self._dac_code[0]:
+            self.dac_write(0, code) # Channel 0 = DAC A
 
     @property
     def audio_2_out(self):
         """DAC Audio 2 Output value (Raw 16-bit input)."""
-        return self._audio_2_out_value
+        return self._audio_out_value[1]
 
     @audio_2_out.setter
     def audio_2_out(self, value):
         """Sets DAC Audio 2 Output. Accepts 16-bit (0-65535), scales to 12-bit (0-4095)."""
         # Store the raw 16-bit input value
-        self._audio_2_out_value = value
+        self._audio_out_value[1] = value
         
-        # Write to DAC (inverted: 4095 - dac_value)
-        self.dac_write(1, 4095 - (int(value) // 16)) # Channel 1 = DAC B
+        # Write to DAC (inverted: 4095 - dac_value), skipped if the DAC already has it
+        code = (4095 - (int(value) // 16)) & 0xFFF
+        if code != self._dac_code[1]:
+            self.dac_write(1, code) # Channel 1 = DAC B
 
     @property
     def cv_1_out(self):
@@ -243,7 +323,10 @@ class Computer:
     @cv_1_out.setter
     def cv_1_out(self,val):
         # FIX: Set inverted duty_cycle
-        self.cv_1_pwm.duty_cycle = 65535 - min(max(int(val), 0), 65535)
+        duty = 65535 - min(max(int(val), 0), 65535)
+        if duty != self._cv_out_duty[0]:
+            self._cv_out_duty[0] = duty
+            self.cv_1_pwm.duty_cycle = duty
 
     @property
     def cv_2_out(self):
@@ -252,52 +335,112 @@ class Computer:
     @cv_2_out.setter
     def cv_2_out(self,val):
         # FIX: Set inverted duty_cycle
-        self.cv_2_pwm.duty_cycle = 65535 - min(max(int(val), 0), 65535)
-
-    def mux_update(self, num):
-        """Update the mux channel, used by ``update()``"""
-        self.mux_A.value = (num >> 0) & 1
-        self.mux_B.value = (num >> 1) & 1
-
-    def mux_read(self, num):
-        """Read into the ``analog`` list new values for
-        the given mux channel, used by ``update()``"""
-        s = self.analog_smooth_amount
-        if num == 0:
-            self.analog[4] = int(s*self.analog[4] + (1-s)*self.analog_mux1.value)  # main knob
-            self.analog[2] = int(s*self.analog[2] + (1-s)*self.analog_mux2.value)  # CV 1 (inverted)
-        elif num == 1:
-            self.analog[5] = int(s*self.analog[5] + (1-s)*self.analog_mux1.value)  # X knob
-            self.analog[3] = int(s*self.analog[3] + (1-s)*self.analog_mux2.value)  # CV 2 (inverted)
-        elif num == 2:
-            self.analog[6] = int(s*self.analog[6] + (1-s)*self.analog_mux1.value)  # Y knob
-            self.analog[2] = int(s*self.analog[2] + (1-s)*self.analog_mux2.value)  # CV 1 (inverted)
-        elif num == 3:
-            self.analog[7] = int(s*self.analog[7] + (1-s)*self.analog_mux1.value)  # Switch
-            self.analog[3] = int(s*self.analog[3] + (1-s)*self.analog_mux2.value)  # CV 2 (inverted)        
+        duty = 65535 - min(max(int(val), 0), 65535)
+        if duty != self._cv_out_duty[1]:
+            self._cv_out_duty[1] = duty
+            self.cv_2_pwm.duty_cycle = duty
+
+    def set_cv(self, ch, v):
+        """
+        Fast CV output, like setting ``cv_1_out`` (ch 0) or ``cv_2_out`` (ch 1) but unchecked:
+        ``v`` must already be an int in 0-65535, e.g. straight from an input.
+        """
+        duty = 65535 - v
+        if duty != self._cv_out_duty[ch]:
+            self._cv_out_duty[ch] = duty
+            self._cv_pwm[ch].duty_cycle = duty
 
     def dac_write(self, channel, value):
         """
-        Writes a 12-bit value to the MCP4822 DAC on the specified channel.
+        Writes a 12-bit value to the MCP4822 DAC on the specified channel (0 = A, 1 = B).
         """
         # DAC configuration data: Control bits (Gain/Buffer/Shutdown) + 12-bit data
-        if channel == 0:
-            DAC_data = DAC_config_chan_A_gain | (value & 0xFFF)
-        else:
-            DAC_data = DAC_config_chan_B_gain | (value & 0xFFF)
+        value &= 0xFFF
+        self._dac_code[channel] = value
 
         # Pack the 16 bits (4 control + 12 data) into two bytes
-        data_to_send = bytes( (DAC_data >> 8, DAC_data & 0xFF) )
+        b = self._dac_buf
+        b[0] = _HI_BASE[channel] | (value >> 8)
+        b[1] = value & 0xFF
 
-        # Must acquire SPI lock, lower CS, write, raise CS, then release lock
-        if self.dac_spi.try_lock():
-            try:
-                self.dac_cs.value = False  # Chip Select LOW to start transfer
-                self.dac_spi.write(data_to_send)
-                self.dac_cs.value = True   # Chip Select HIGH to finish transfer
-            finally:
-                self.dac_spi.unlock()
+        # SPI lock is already held, lower CS, write, raise CS
+        self.dac_cs.value = False  # Chip Select LOW to start transfer
+        self.dac_spi.write(b)
+        self.dac_cs.value = True   # Chip Select HIGH to finish transfer
 
+    def set_audio_out(self, ch, v):
+        """
+        Fast DAC audio output, same as setting ``audio_1_out`` (ch 0) or ``audio_2_out`` (ch 1)
+        but without the property dispatch. ``v`` must be an int, raw 16-bit (0-65535).
+        """
+        self._audio_out_value[ch] = v
+        code = (4095 - (v >> 4)) & 0xFFF  # inverted, scaled to 12-bit
+        if code == self._dac_code[ch]:
+            return  # DAC already has it
+        self._dac_code[ch] = code
+        b = self._dac_buf
+        b[0] = _HI_BASE[ch] | (code >> 8)
+        b[1] = code & 0xFF
+        self.dac_cs.value = False
+        self.dac_spi.write(b)
+        self.dac_cs.value = True
+
+    def dac_write_both(self, value_a, value_b):
+        """
+        Writes 12-bit values to both MCP4822 DAC channels (A then B).
+        """
+        value_a &= 0xFFF
+        value_b &= 0xFFF
+        self._dac_code[0] = value_a
+        self._dac_code[1] = value_b
+        b = self._dac_buf4
+        b[0] = _HI_BASE[0] | (value_a >> 8)
+        b[1] = value_a & 0xFF
+        b[2] = _HI_BASE[1] | (value_b >> 8)
+        b[3] = value_b & 0xFF
+        dac_cs = self.dac_cs
+        dac_spi = self.dac_spi
+        # MCP4822 only takes one 16-bit word per CS frame, so each channel gets its own
+        dac_cs.value = False
+        dac_spi.write(b, end=2)
+        dac_cs.value = True
+        dac_cs.value = False
+        dac_spi.write(b, start=2)
+        dac_cs.value = True
+
+    def set_audio_both(self, v0, v1):
+        """
+        Fast DAC audio output for both channels, same as ``set_audio_out(0, v0)``
+        then ``set_audio_out(1, v1)`` in one call. Values must be ints, raw 16-bit (0-65535).
+        """
+        av = self._audio_out_value
+        av[0] = v0
+        av[1] = v1
+        c0 = (4095 - (v0 >> 4)) & 0xFFF  # inverted, scaled to 12-bit
+        c1 = (4095 - (v1 >> 4)) & 0xFFF
+        dc = self._dac_code
+        b = self._dac_buf4
+        dac_cs = self.dac_cs
+        dac_spi = self.dac_spi
+        # both words share one buffer, but each still needs its own CS frame
+        if c0 != dc[0]:
+            dc[0] = c0
+            b[0] = _HI_BASE[0] | (c0 >> 8)
+            b[1] = c0 & 0xFF
+            dac_cs.value = False
+            dac_spi.write(b, end=2)
+            dac_cs.value = True
+        if c1 != dc[1]:
+            dc[1] = c1
+            b[2] = _HI_BASE[1] | (c1 >> 8)
+            b[3] = c1 & 0xFF
+            dac_cs.value = False
+            dac_spi.write(b, start=2)
+            dac_cs.value = True
+
+    def close(self):
+        """Release the DAC SPI bus lock held since construction"""
+        self.dac_spi.unlock()
 
     def pulse_outs_to_audio(self, sample_rate=22050, voice_count=5, channel_count=2):
         """Convert the pulse outs to play PWM audio """
@@ -17,10 +17,6 @@ comp = Computer()
 
 last_time = 0
 
-def gamma_correct(x):
-    """simple and dumb brightness gamma-correction"""
-    return int((x*x)/65535)
-
 t = 0
 dt = 0.01
 
@@ -36,12 +32,8 @@ while True:
     t += dt
     
     # LEDs reflect state of knobs/CV
-    comp.leds[0].duty_cycle = gamma_correct(comp.knob_main)
-    comp.leds[1].duty_cycle = gamma_correct(comp.knob_x)
-    comp.leds[2].duty_cycle = gamma_correct(comp.knob_y)
-    comp.leds[3].duty_cycle = gamma_correct(comp.switch)
-    comp.leds[4].duty_cycle = gamma_correct(comp.cv_1_out)
-    comp.leds[5].duty_cycle = gamma_correct(comp.cv_2_out)
+    comp.leds_set_all(comp.knob_main, comp.knob_x, comp.knob_y,
+                      comp.switch, comp.cv_1_out, comp.cv_2_out)
     
     # Print out the input state periodically
     if time.monotonic() - last_time > 0.2: